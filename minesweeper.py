@@ -1,16 +1,98 @@
 """Module contains minesweeper logic."""
-import random
-from typing import List, Tuple
-from collections import namedtuple
-# Importing namedtuple from collections for easier work with the coordinates of the grid.
-Coordinate = namedtuple("Coordinate", "row column")
+import re
+import sys
+from typing import Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the hint search then expands whole BFS levels with NumPy.
+    njit = None
+
+# User guess input: row and column separated by a comma and/or whitespace.
+_COORD_RE = re.compile(r"^(\d+)\s*[,\s]\s*(\d+)$")
+# Rendered cell strings indexed by 0 for an unopened cell, or surrounding mine count + 1 for an opened one.
+_CELL_STRINGS = np.array([repr(" ")] + [repr(str(count)) for count in range(9)])
+
+
+def _bfs_hint(mines, is_open, surrounding, visited, hinted, neighbours, neighbour_count, seed):
+    """Breadth-first flood fill from the seed cell looking for a safe unopened cell.
+
+    All cell arrays are flat (row-major) views of the grid. Cells are marked in `visited`
+    when they are dequeued, so later searches skip them.
+
+    :return: int, flat index (row * width + col) of the found cell, or -1 if none is reachable.
+    """
+    queue = np.empty(mines.size, np.int32)
+    queued = np.zeros(mines.size, np.uint8)
+    head = 0
+    tail = 1
+    queue[0] = seed
+    queued[seed] = 1
+    while head < tail:
+        index = queue[head]
+        head += 1
+        visited[index] = 1
+        if is_open[index] == 0 and mines[index] == 0 and surrounding[index] == 0 and hinted[index] == 0:
+            return index
+        for k in range(neighbour_count[index]):
+            neighbour = neighbours[index, k]
+            if queued[neighbour] == 0 and visited[neighbour] == 0:
+                queued[neighbour] = 1
+                queue[tail] = neighbour
+                tail += 1
+    return -1
+
+
+def _bfs_hint_frontier(mines, is_open, surrounding, visited, hinted, neighbours, neighbour_count, seed):
+    """Level-by-level variant of `_bfs_hint` that expands the whole BFS frontier with NumPy indexing.
+
+    Returns the same cell and leaves `visited` in the same state as `_bfs_hint`, without a per-cell Python loop.
+
+    :return: int, flat index (row * width + col) of the found cell, or -1 if none is reachable.
+    """
+    frontier = np.array([seed], np.int64)
+    queued = np.zeros(mines.size, np.bool_)
+    queued[seed] = True
+    while frontier.size:
+        safe = np.flatnonzero((is_open[frontier] == 0) & (mines[frontier] == 0)
+                              & (surrounding[frontier] == 0) & (hinted[frontier] == 0))
+        if safe.size:
+            visited[frontier[:safe[0] + 1]] = 1
+            return int(frontier[safe[0]])
+        visited[frontier] = 1
+        candidates = neighbours[frontier].reshape(-1)
+        candidates = candidates[candidates >= 0]
+        candidates = candidates[~queued[candidates] & (visited[candidates] == 0)]
+        # Keep the first occurrence of each cell, in queue order.
+        _, first = np.unique(candidates, return_index=True)
+        frontier = candidates[np.sort(first)]
+        queued[frontier] = True
+    return -1
+
+
+if njit is not None:
+    # The explicit signature compiles the kernel at import time and, with cache=True, stores it on disk
+    # so later runs skip JIT compilation.
+    _bfs_hint = njit("int64(uint8[::1], uint8[::1], int8[::1], uint8[::1], uint8[::1], "
+                     "int32[:, ::1], int8[::1], int64)", cache=True, boundscheck=False)(_bfs_hint)
+else:
+    _bfs_hint = _bfs_hint_frontier
+
+
+def _write_rows(cells: np.ndarray) -> None:
+    """Write a matrix of rendered cell strings to stdout in a single call, one list-style row per line."""
+    sys.stdout.write("".join(f"[{', '.join(row)}]\n" for row in cells.tolist()))
 
 
 class Cell:
-    """Represents a single grid cell."""
+    """Read-only view of a single grid cell, used for rendering."""
+
+    __slots__ = ('has_mine', 'surrounding_mines_count', 'is_open')
 
     def __init__(self, has_mine: bool, surrounding_mines_count: int, is_open: bool = False) -> None:
-        """Initialize a single cell of the grid.
+        """Initialize a single cell view of the grid.
 
         :param has_mine: bool, following cell contains a mine,
         :param surrounding_mines_count: int, number of surrounding mines around cell[row][col],
@@ -20,17 +102,6 @@ class Cell:
         self.surrounding_mines_count = surrounding_mines_count
         self.is_open = is_open
 
-    def open(self):
-        """Mark the cell as opened."""
-        self.is_open = True
-
-    def unopened_non_mine(self) -> bool:
-        """Check if the cell is unopened and not a mine.
-
-        :return: bool, True if the cell is unopened and not a mine, False otherwise.
-        """
-        return self.is_open is False and self.has_mine is False
-
     def __str__(self) -> str:
         """Return the string representation of the cell.
 
@@ -47,6 +118,9 @@ class Cell:
 class Grid:
     """Represents the Minesweeper game grid."""
 
+    # (row, column) offsets of the eight neighbours of a cell.
+    _NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
     def __init__(self, width: int, height: int, difficulty: int) -> None:
         """Initialize the grid with the given width, height, and difficulty level.
 
@@ -57,7 +131,10 @@ class Grid:
         self.width = width
         self.height = height
         self.difficulty = difficulty
-        self.cells = self._create_empty_cells()
+        # Cell state is stored as parallel arrays (one byte per cell) instead of a list of Cell objects.
+        self.mines = np.zeros((height, width), np.uint8)
+        self.surrounding = np.zeros((height, width), np.int8)
+        self.is_open = np.zeros((height, width), np.uint8)
         total_cells = self.width * self.height
         if difficulty == 1:
             self.mine_count = max(1, int(total_cells * 0.10))
@@ -67,96 +144,88 @@ class Grid:
             self.mine_count = max(3, int(total_cells * 0.20))
 
         self._set_cell_mines_and_surrounding_counts()
-        self.hinted_cells = set()
+        # Number of non-mine cells still to be opened, kept up to date by open().
+        self._remaining = total_cells - self.mine_count
+        self._hinted = np.zeros((height, width), np.uint8)
+        self._visited = np.zeros((height, width), np.uint8)
+        self._neighbours, self._neighbour_count = self._build_neighbour_tables()
 
     def has_unopened_non_mines(self) -> bool:
         """Check if there are any unopened non-mine cells left.
 
         :return: bool, True if there are unopened non-mine cells, False otherwise.
         """
-        for row in self.cells:
-            for cell in row:
-                if cell.unopened_non_mine():
-                    return True
-        return False
-
-    def _create_empty_cells(self) -> List[List[Cell]]:
-        """Create an empty grid of cells.
-
-        :return: List of lists containing Cell objects, all initialized without mines.
-        """
-        return [[Cell(has_mine=False, surrounding_mines_count=0) for _ in range(self.width)] for _ in range(self.height)]
+        return self._remaining > 0
 
-    def _set_cell_mines_and_surrounding_counts(self) -> None:
-        """Set the mines and calculate the surrounding mine counts for each cell."""
-        coordinate_positions = self._generate_grid_coordinate_positions()
-        mine_positions = self._generate_mine_positions(coordinate_positions)
-        self._place_mines(mine_positions)
-        non_mine_positions = self._identify_non_mine_positions(coordinate_positions, mine_positions)
-        self._set_surrounding_mine_count(non_mine_positions)
-
-    def _generate_grid_coordinate_positions(self) -> List[Tuple[int, int]]:
-        """Generate a list of all possible coordinate positions on the grid.
-
-        :return: List of tuples representing each cell's coordinates (row, column).
-        """
-        return [(row, col) for row in range(self.height) for col in range(self.width)]
-
-    def _generate_mine_positions(self, coordinate_positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """Randomly select mine positions from the grid.
+    def cell(self, row_index: int, column_index: int) -> Cell:
+        """Return a view of the cell at the given position.
 
-        :param: coordinate_positions: List of all possible coordinates on the grid,
-        :return: List of tuples representing the mine positions (row, column).
+        :param: row_index: int, row index of the cell,
+        :param: column_index: int, column index of the cell,
+        :return: Cell, snapshot of the cell state.
         """
-        return random.sample(coordinate_positions, self.mine_count)
+        return Cell(has_mine=bool(self.mines[row_index, column_index]),
+                    surrounding_mines_count=int(self.surrounding[row_index, column_index]),
+                    is_open=bool(self.is_open[row_index, column_index]))
 
-    def _identify_non_mine_positions(self, coordinate_positions: List[Tuple[int, int]],
-                                     mine_positions: List[Tuple[int, int]]) -> set:
-        """Identify the coordinates that do not contain mines.
+    def open(self, row_index: int, column_index: int) -> None:
+        """Mark the cell at the given position as opened.
 
-        :param: coordinate_positions: List of all possible coordinates on the grid,
-        :param: mine_positions: List of coordinates containing mines,
-        :return: Set of coordinates that are non-mine positions.
+        :param: row_index: int, row index of the cell,
+        :param: column_index: int, column index of the cell,
         """
-        return set(coordinate_positions) - set(mine_positions)
+        if not self.is_open[row_index, column_index]:
+            self.is_open[row_index, column_index] = 1
+            if not self.mines[row_index, column_index]:
+                self._remaining -= 1
 
-    def _place_mines(self, mine_positions: List[Tuple[int, int]]) -> List[List[Cell]]:
-        """Place mines in the corresponding cell objects.
+    def _build_neighbour_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Precompute the flat indices of every cell's neighbours.
 
-        :param: mine_positions: List of coordinates where mines will be placed,
-        :return: List of lists representing the grid after mines are placed.
+        :return: Tuple of an int32 array of shape (height * width, 8) holding the neighbour indices
+                 packed to the front of each row, and an int8 array with the neighbour count of each cell.
         """
-        for row_index, column_index in mine_positions:
-            self.cells[row_index][column_index].has_mine = True
-        return self.cells
+        offsets = np.array(self._NEIGHBOR_OFFSETS, np.int32)
+        rows, columns = np.divmod(np.arange(self.height * self.width, dtype=np.int32), self.width)
+        neighbour_rows = rows[:, None] + offsets[:, 0]
+        neighbour_columns = columns[:, None] + offsets[:, 1]
+        valid = ((neighbour_rows >= 0) & (neighbour_rows < self.height)
+                 & (neighbour_columns >= 0) & (neighbour_columns < self.width))
+        # Stable sort moves the valid neighbours to the front while keeping their order.
+        order = np.argsort(~valid, axis=1, kind="stable")
+        neighbours = np.take_along_axis(neighbour_rows * self.width + neighbour_columns, order, axis=1)
+        neighbours[~np.take_along_axis(valid, order, axis=1)] = -1
+        return (np.ascontiguousarray(neighbours, dtype=np.int32),
+                np.ascontiguousarray(valid.sum(axis=1), dtype=np.int8))
 
-    def _is_valid_position(self, row_index: int, column_index: int) -> bool:
-        """Check if the given position is valid within the grid.
+    def _set_cell_mines_and_surrounding_counts(self) -> None:
+        """Set the mines and calculate the surrounding mine counts for each cell.
 
-        :param: row_index: int, row index to check,
-        :param: column_index: int, column index to check,
-        :return: bool, True if the position is valid, False otherwise.
+        Mines are sampled as flat (row-major) indices. The counts are the 3x3 box sum of a zero-padded
+        mine mask, computed separably (three-wide row sums, then three-tall column sums of those),
+        minus the cell's own mine. Cells containing a mine keep a count of 0.
         """
-        return 0 <= row_index < self.height and 0 <= column_index < self.width
-
-    def _set_surrounding_mine_count(self, non_mine_positions: set[Tuple[int, int]]) -> None:
-        """Set the surrounding mine count for each non-mine cell.
-
-        :param: non_mine_positions: Set of coordinates that do not contain mines,
+        height, width = self.height, self.width
+        mine_indices = np.random.choice(width * height, self.mine_count, replace=False)
+        self.mines.reshape(-1)[mine_indices] = 1
+        padded = np.zeros((height + 2, width + 2), np.int8)
+        padded[1:-1, 1:-1] = self.mines
+        row_sums = padded[:, 0:width] + padded[:, 1:width + 1]
+        row_sums += padded[:, 2:width + 2]
+        np.add(row_sums[0:height], row_sums[1:height + 1], out=self.surrounding)
+        self.surrounding += row_sums[2:height + 2]
+        self.surrounding[self.mines != 0] = 0
+
+    def render(self) -> np.ndarray:
+        """Build the visible cell strings for the whole grid at once.
+
+        :return: np.ndarray of shape (height, width) with the rendered string of each cell.
         """
-        for empty_row_index, empty_column_index in non_mine_positions:
-            count = 0
-            for row_index in range(empty_row_index - 1, empty_row_index + 2):
-                for column_index in range(empty_column_index - 1, empty_column_index + 2):
-                    if self._is_valid_position(row_index, column_index) and self.cells[row_index][column_index].has_mine:
-                        count += 1
-            self.cells[empty_row_index][empty_column_index].surrounding_mines_count = count
+        return _CELL_STRINGS[np.where(self.is_open != 0, self.surrounding + 1, 0)]
 
     def print(self) -> None:
         """Print the current state of the grid."""
-        for row in self.cells:
-            visible_row = [str(cell) for cell in row]
-            print(visible_row)
+        _write_rows(self.render())
 
     def is_cell_open(self, row_index: int, column_index: int) -> bool:
         """Check if a specific cell is open.
@@ -165,69 +234,55 @@ class Grid:
         :param: column_index: int, column index of the cell,
         :return: bool, True if the cell is open, False otherwise.
         """
-        return self.cells[row_index][column_index].is_open
+        return bool(self.is_open[row_index, column_index])
 
-    def has_mine(self, coordinate: Coordinate) -> bool:
-        """Check if the given coordinate contains a mine.
+    def has_mine(self, row_index: int, column_index: int) -> bool:
+        """Check if the given cell contains a mine.
 
-        :param: coordinate: Coordinate, representing the row and column of the cell,
+        :param: row_index: int, row index of the cell,
+        :param: column_index: int, column index of the cell,
         :return: bool, True if the cell contains a mine, False otherwise.
         """
-        return self.cells[coordinate.row][coordinate.column].has_mine
+        return bool(self.mines[row_index, column_index])
 
     def hint(self):
         """
-        Provides a hint using recursive backtracking.
-        The search starts from a random unopened cell and recursively explores neighbors.
+        Provides a hint using an iterative breadth-first flood fill.
+        The search starts from an unopened, non-mine cell and explores neighbours level by level.
         """
-        # Iterate over the entire grid, pick any unopened, non-mine cell as the starting point
-        for row in range(self.height):
-            for col in range(self.width):
-                if (row, col) not in self.hinted_cells and not self.cells[row][col].is_open \
-                        and not self.cells[row][col].has_mine:
-                    # Perform the recursive search starting from this cell
-                    result = self._recursive_backtrack_search(row, col, set())
-                    if result:
-                        self.hinted_cells.add(result)
-                        return result
+        # Pick any unopened, non-mine cell not reached by an earlier search as the starting point
+        seeds = np.argwhere((self.is_open == 0) & (self.mines == 0) & (self._visited == 0))
+        for row, col in seeds:
+            if not self._visited[row, col]:
+                result = self._flood_fill_search(int(row), int(col))
+                if result:
+                    self._hinted[result] = 1
+                    return result
 
         # If no hint is found
         return None
 
-    def _recursive_backtrack_search(self, row, col, visited):
+    def _flood_fill_search(self, row, col):
         """
-        Helper method to recursively search for a safe unopened cell.
+        Helper method to search for a safe unopened cell with a compiled flood-fill kernel.
+        Visited cells stay marked between calls, so a cell is never hinted twice.
         """
-        # Mark this cell as visited
-        visited.add((row, col))
-
-        # If the current cell is unopened and safe, return it as a hint
-        if (row, col) not in self.hinted_cells and not self.cells[row][col].is_open \
-                and not self.cells[row][col].has_mine:
-            if self.cells[row][col].surrounding_mines_count == 0:
-                return row, col  # Found a completely safe cell
-
-        # Recursively search the neighbors
-        for neighbour_row, neighbour_col in self.get_neighbours(row, col):
-            if (neighbour_row, neighbour_col) not in visited:
-                result = self._recursive_backtrack_search(neighbour_row, neighbour_col, visited)
-                if result:
-                    return result  # If a safe cell is found, return it
-
-        # If no safe cells are found in this path, backtrack
-        return None
+        index = _bfs_hint(self.mines.reshape(-1), self.is_open.reshape(-1), self.surrounding.reshape(-1),
+                          self._visited.reshape(-1), self._hinted.reshape(-1),
+                          self._neighbours, self._neighbour_count, row * self.width + col)
+        if index < 0:
+            return None
+        return divmod(int(index), self.width)
 
     def get_neighbours(self, row, col):
         """
-        Returns the list of valid neighbors around a given cell (row, col).
+        Yields the valid neighbors around a given cell (row, col).
         It considers all 8 possible neighbors in a 2D grid.
         """
-        neighbours = []
-        for r in range(max(0, row - 1), min(self.height, row + 2)):
-            for c in range(max(0, col - 1), min(self.width, col + 2)):
-                if (r, c) != (row, col):  # Exclude the current cell itself
-                    neighbours.append((r, c))
-        return neighbours
+        for row_offset, col_offset in self._NEIGHBOR_OFFSETS:
+            r, c = row + row_offset, col + col_offset
+            if 0 <= r < self.height and 0 <= c < self.width:
+                yield r, c
 
 
 class Minesweeper:
@@ -242,51 +297,49 @@ class Minesweeper:
         """
         self.grid = Grid(width, height, difficulty)
 
-    def _get_valid_coordinate(self, plane: str, max_index: int) -> int:
-        """Get a valid coordinate input from the user.
+    def _get_user_guess(self) -> Tuple[int, int]:
+        """Get a valid cell guess (row, column) from the user.
+
+        The row and column are entered on one line, separated by a comma or a space.
 
-        :param: plane: str, indicating whether the input is for the row or column,
-        :param: max_index: int, the maximum allowed value for the coordinate,
-        :return: int, a valid coordinate within the grid,
+        :return: Tuple[int, int], the user-selected cell's (row, column),
         """
-        prompt_str = f"Enter {plane} coordinate between 0 and {max_index}: "
-        prompt = prompt_str.format(plane=plane, max_index=max_index)
+        max_row_index = self.grid.height - 1
+        max_col_index = self.grid.width - 1
+        prompt = f"Enter row (0-{max_row_index}) and column (0-{max_col_index}) as 'row,column': "
         while True:
-            try:
-                coordinate = int(input(prompt))
-            except ValueError:
-                print("Invalid input. Please enter a valid number.")
+            match = _COORD_RE.match(input(prompt).strip())
+            if match is None:
+                print("Invalid input. Please enter two numbers separated by a comma, e.g. 1,2.")
+                continue
+            row_index, column_index = int(match.group(1)), int(match.group(2))
+            if row_index > max_row_index or column_index > max_col_index:
+                print(f"Invalid input. The row must be between 0 and {max_row_index} "
+                      f"and the column between 0 and {max_col_index}.")
+            elif self.grid.is_cell_open(row_index=row_index, column_index=column_index):
+                print("Invalid input. The cell is already opened. Please choose another cell.")
             else:
-                if 0 <= coordinate <= max_index:
-                    return coordinate
-                else:
-                    print(f"Invalid input. Please enter a number between 0 and {max_index}.")
+                return row_index, column_index
 
-    def _get_user_guess(self) -> Coordinate:
-        """Get a valid cell guess (row, column) from the user.
+    def _render(self, mine_position: Optional[Tuple[int, int]] = None) -> None:
+        """Print the grid, optionally marking a guessed mine.
 
-        :return: Coordinate, the user-selected cell's coordinates,
+        :param: mine_position: optional (row, column) of the guessed mine, rendered as "X",
         """
-        while True:
-            max_row_index = self.grid.width - 1
-            max_col_index = self.grid.height - 1
-            column_index = self._get_valid_coordinate(plane="column", max_index=max_row_index)
-            row_index = self._get_valid_coordinate(plane="row", max_index=max_col_index)
-
-            if self.grid.is_cell_open(row_index=row_index, column_index=column_index):
-                print("Invalid input. The cell is already opened. Please choose another cell.")
-            else:
-                return Coordinate(row_index, column_index)
+        cells = self.grid.render()
+        if mine_position is not None:
+            cells[mine_position] = repr('X')
+        _write_rows(cells)
 
-    def _has_guessed_mine(self, user_coordinate_guess: Coordinate) -> bool:
+    def _has_guessed_mine(self, row_index: int, column_index: int) -> bool:
         """Check if the user has guessed a mine.
 
-        :param: user_coordinate_guess: Coordinate, the guessed cell's coordinates,
+        :param: row_index: int, row index of the guessed cell,
+        :param: column_index: int, column index of the guessed cell,
         :return: bool, True if the guessed cell contains a mine, False otherwise.
         """
-        if self.grid.has_mine(user_coordinate_guess):
-            self.grid.cells[user_coordinate_guess.row][user_coordinate_guess.column] = 'X'
-            self.grid.print()
+        if self.grid.has_mine(row_index, column_index):
+            self._render(mine_position=(row_index, column_index))
             print("You guessed a mine.")
             return True
         else:
@@ -309,19 +362,19 @@ class Minesweeper:
         while self.grid.has_unopened_non_mines():
             action = input("Enter 'play' to make a move, or 'hint' to get a hint: ").strip().lower()
             if action == 'play':
-                self.grid.print()
-                user_coordinate_guess = self._get_user_guess()
-                if self._has_guessed_mine(user_coordinate_guess):
+                self._render()
+                row_index, column_index = self._get_user_guess()
+                if self._has_guessed_mine(row_index, column_index):
                     print("Game Over:(")
                     break
                 else:
                     # Open the guessed cell if it is a valid non-mine guess
-                    self.grid.cells[user_coordinate_guess.row][user_coordinate_guess.column].open()
-                    self.grid.print()
+                    self.grid.open(row_index, column_index)
+                    self._render()
             elif action == 'hint':
                 self.request_hint()
             else:
                 print("Invalid option. Please choose 'play' or 'hint'.")
         else:
-            self.grid.print()
+            self._render()
             print("Congratulations, you won!")